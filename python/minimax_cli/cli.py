@@ -1,15 +1,28 @@
 """Thin wrapper that downloads and runs the MiniMax CLI binary."""
 
 import os
-import platform
-import stat
 import sys
 from pathlib import Path
-from urllib.request import urlopen
+from typing import Optional
 
 from minimax_cli import __version__
 
 REPO = "Hmbown/MiniMax-CLI"
+CHUNK_SIZE = 1024 * 1024
+
+ARCH_ALIASES = {
+    "x86_64": "x64",
+    "amd64": "x64",
+    "arm64": "arm64",
+    "aarch64": "arm64",
+}
+
+ASSETS = {
+    ("linux", "x64"): "minimax-linux-x64",
+    ("darwin", "arm64"): "minimax-macos-arm64",
+    ("darwin", "x64"): "minimax-macos-x64",
+    ("windows", "x64"): "minimax-windows-x64.exe",
+}
 
 
 def main() -> None:
@@ -22,63 +35,120 @@ def resolve_binary() -> str:
     """Find or download the minimax binary."""
     # Allow override via environment
     override = os.getenv("MINIMAX_CLI_PATH")
-    if override and Path(override).exists():
+    if override and os.path.exists(override):
         return override
 
-    # Check cache
-    cache_dir = Path.home() / ".minimax" / "bin" / __version__
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    asset_name = get_asset_name()
+    # Check cache first: nearly every launch hits it, so do no other work.
+    # Plain os.path strings keep this path free of Path object churn.
+    cache_dir = os.path.join(os.path.expanduser("~"), ".minimax", "bin", __version__)
     bin_name = "minimax.exe" if sys.platform == "win32" else "minimax"
-    dest = cache_dir / bin_name
+    dest = os.path.join(cache_dir, bin_name)
 
-    if dest.exists():
-        return str(dest)
+    if os.path.exists(dest):
+        return dest
 
     if os.getenv("MINIMAX_CLI_SKIP_DOWNLOAD") in ("1", "true", "TRUE"):
         raise RuntimeError("minimax binary not found and downloads are disabled.")
 
+    asset_name = get_asset_name()
+    os.makedirs(cache_dir, exist_ok=True)
+
     # Download from GitHub releases
     url = f"https://github.com/{REPO}/releases/download/v{__version__}/{asset_name}"
     print(f"Downloading MiniMax CLI v{__version__}...", file=sys.stderr)
-    download_binary(url, dest)
-    return str(dest)
+    download_binary(url, Path(dest))
+    return dest
 
 
 def get_asset_name() -> str:
     """Get the release asset name for this platform."""
+    import platform
+
     system = platform.system().lower()
     arch = platform.machine().lower()
 
-    if system == "linux" and arch in ("x86_64", "amd64"):
-        return "minimax-linux-x64"
-    if system == "darwin" and arch in ("arm64", "aarch64"):
-        return "minimax-macos-arm64"
-    if system == "darwin" and arch in ("x86_64", "amd64"):
-        return "minimax-macos-x64"
-    if system == "windows" and arch in ("x86_64", "amd64", "amd64"):
-        return "minimax-windows-x64.exe"
-
-    raise RuntimeError(f"Unsupported platform: {system}/{arch}")
+    asset = ASSETS.get((system, ARCH_ALIASES.get(arch)))
+    if asset is None:
+        raise RuntimeError(f"Unsupported platform: {system}/{arch}")
+    return asset
 
 
 def download_binary(url: str, dest: Path) -> None:
     """Download binary from URL to destination."""
+    # Imported here so cache-hit launches never load the network stack.
+    import hashlib
+    import stat
+    from urllib.request import urlopen
+
+    expected = fetch_expected_sha256(url)
+
+    # Stream to a sibling temp file so memory stays bounded and an
+    # interrupted download never leaves a truncated binary at dest.
+    # Bytes are hashed as they pass through, so verification costs no re-read.
+    tmp = dest.with_name(dest.name + ".download")
+    digest = hashlib.sha256()
     try:
-        with urlopen(url, timeout=60) as response:
-            data = response.read()
+        with urlopen(url, timeout=60) as response, tmp.open("wb") as handle:
+            preallocate(handle.fileno(), response.headers.get("Content-Length"))
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                handle.write(chunk)
+            # Drop any preallocated tail if the body was shorter than advertised
+            handle.truncate()
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         raise RuntimeError(f"Failed to download: {e}") from e
 
-    dest.write_bytes(data)
+    if expected is not None and digest.hexdigest() != expected:
+        tmp.unlink(missing_ok=True)
+        raise RuntimeError(f"Checksum mismatch for {url}")
 
     # Make executable on Unix
     if sys.platform != "win32":
-        dest.chmod(dest.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        tmp.chmod(tmp.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    os.replace(tmp, dest)
 
     print(f"Installed to {dest}", file=sys.stderr)
 
 
+def preallocate(fd: int, content_length: Optional[str]) -> None:
+    """Reserve the full file size up front so the filesystem can lay it out contiguously."""
+    if not content_length or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, int(content_length))
+    except (OSError, ValueError):
+        # Not every filesystem supports it; the download works without it.
+        pass
+
+
+def fetch_expected_sha256(url: str) -> Optional[str]:
+    """Fetch the published SHA-256 for a release asset, if the release has one."""
+    from urllib.error import HTTPError
+    from urllib.request import urlopen
+
+    try:
+        with urlopen(f"{url}.sha256", timeout=30) as response:
+            text = response.read().decode("ascii", errors="replace")
+    except HTTPError as e:
+        # Older releases were published without checksum files.
+        if e.code == 404:
+            return None
+        raise RuntimeError(f"Failed to download checksum: {e}") from e
+    except Exception as e:
+        raise RuntimeError(f"Failed to download checksum: {e}") from e
+
+    # sha256sum format: "<hex digest>  <file name>"
+    fields = text.split()
+    digest = fields[0].lower() if fields else ""
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise RuntimeError(f"Malformed checksum file at {url}.sha256")
+    return digest
+
+
 if __name__ == "__main__":
     main()
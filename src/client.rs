@@ -189,29 +189,35 @@ where
                         .unwrap_or_else(|e| format!("(failed to read body: {e})"));
                     anyhow::bail!("Failed to send API request: HTTP {status}: {text}");
                 }
-                logging::warn(format!(
-                    "Retryable HTTP {} (attempt {} of {})",
-                    status.as_u16(),
-                    attempt + 1,
-                    policy.max_retries + 1
-                ));
+                if logging::is_verbose() {
+                    logging::warn(format!(
+                        "Retryable HTTP {} (attempt {} of {})",
+                        status.as_u16(),
+                        attempt + 1,
+                        policy.max_retries + 1
+                    ));
+                }
             }
             Err(err) => {
                 if !policy.enabled || attempt >= policy.max_retries {
                     return Err(err.into());
                 }
-                logging::warn(format!(
-                    "Request error: {} (attempt {} of {})",
-                    err,
-                    attempt + 1,
-                    policy.max_retries + 1
-                ));
+                if logging::is_verbose() {
+                    logging::warn(format!(
+                        "Request error: {} (attempt {} of {})",
+                        err,
+                        attempt + 1,
+                        policy.max_retries + 1
+                    ));
+                }
             }
         }
 
         let delay = policy.delay_for_attempt(attempt);
         attempt += 1;
-        logging::info(format!("Retrying after {:.2}s", delay.as_secs_f64()));
+        if logging::is_verbose() {
+            logging::info(format!("Retrying after {:.2}s", delay.as_secs_f64()));
+        }
         tokio::time::sleep(delay).await;
     }
 }
@@ -245,7 +251,9 @@ fn parse_sse_stream(
                             return;
                         }
                         // Log raw SSE data for debugging
-                        if data.contains("tool_use") || data.contains("input_json") {
+                        if logging::is_verbose()
+                            && (data.contains("tool_use") || data.contains("input_json"))
+                        {
                             logging::info(format!("SSE tool event: {}", data));
                         }
                         match serde_json::from_str::<StreamEvent>(data) {
@@ -289,6 +289,7 @@ max_retries = 3
 initial_delay = 1.0
 max_delay = 60.0
 exponential_base = 2.0
+jitter = true
 "#
     );
 
@@ -363,6 +364,7 @@ max_retries = 3
 initial_delay = 1.0
 max_delay = 60.0
 exponential_base = 2.0
+jitter = true
 "#
         );
 
@@ -21,6 +21,7 @@ pub struct RetryConfig {
     pub initial_delay: Option<f64>,
     pub max_delay: Option<f64>,
     pub exponential_base: Option<f64>,
+    pub jitter: Option<bool>,
 }
 
 /// RLM configuration loaded from config files.
@@ -53,15 +54,25 @@ pub struct RetryPolicy {
     pub initial_delay: f64,
     pub max_delay: f64,
     pub exponential_base: f64,
+    pub jitter: bool,
 }
 
 impl RetryPolicy {
     /// Compute the backoff delay for a retry attempt.
+    ///
+    /// When `jitter` is set (the default), the delay varies by up to 10% (as in
+    /// `crate::llm_client::RetryConfig`) so concurrent clients hitting the same
+    /// rate limit do not all retry at the same instant.
     #[must_use]
     pub fn delay_for_attempt(&self, attempt: u32) -> std::time::Duration {
         let exponent = i32::try_from(attempt).unwrap_or(i32::MAX);
         let delay = self.initial_delay * self.exponential_base.powi(exponent);
         let delay = delay.min(self.max_delay);
+        let delay = if self.jitter {
+            crate::llm_client::apply_jitter(delay, crate::llm_client::DEFAULT_JITTER_FACTOR)
+        } else {
+            delay
+        };
         std::time::Duration::from_secs_f64(delay)
     }
 }
@@ -497,6 +508,7 @@ impl Config {
             initial_delay: 1.0,
             max_delay: 60.0,
             exponential_base: 2.0,
+            jitter: true,
         };
 
         let Some(cfg) = &self.retry else {
@@ -509,6 +521,7 @@ impl Config {
             initial_delay: cfg.initial_delay.unwrap_or(defaults.initial_delay),
             max_delay: cfg.max_delay.unwrap_or(defaults.max_delay),
             exponential_base: cfg.exponential_base.unwrap_or(defaults.exponential_base),
+            jitter: cfg.jitter.unwrap_or(defaults.jitter),
         }
     }
 }
@@ -1028,4 +1041,42 @@ mod tests {
         config.validate()?;
         Ok(())
     }
+
+    #[test]
+    fn test_retry_policy_delay_has_bounded_jitter() {
+        let policy = Config::default().retry_policy();
+        let mut delays = Vec::new();
+        for _ in 0..20 {
+            let delay = policy.delay_for_attempt(1).as_secs_f64();
+            // 1.0 * 2^1 = 2.0, +/- 10% jitter
+            assert!((1.79..=2.21).contains(&delay), "unexpected delay {delay}");
+            delays.push(delay);
+        }
+        // Jitter must actually vary, or clients still retry in lockstep
+        assert!(
+            delays.iter().any(|d| (d - delays[0]).abs() > f64::EPSILON),
+            "jitter produced identical delays: {delays:?}"
+        );
+    }
+
+    #[test]
+    fn test_retry_policy_jitter_can_be_disabled() {
+        let config = Config {
+            retry: Some(RetryConfig {
+                enabled: None,
+                max_retries: None,
+                initial_delay: None,
+                max_delay: None,
+                exponential_base: None,
+                jitter: Some(false),
+            }),
+            ..Default::default()
+        };
+        let policy = config.retry_policy();
+        assert!(!policy.jitter);
+        assert_eq!(
+            policy.delay_for_attempt(1),
+            std::time::Duration::from_secs(2)
+        );
+    }
 }
@@ -1221,17 +1221,23 @@ impl Engine {
                                 && let Some(tool_state) = tool_uses.get_mut(index)
                             {
                                 tool_state.input_buffer.push_str(&partial_json);
-                                crate::logging::info(format!(
-                                    "Tool '{}' input delta: {} (buffer now: {})",
-                                    tool_state.name, partial_json, tool_state.input_buffer
-                                ));
-                                if let Some(value) = parse_tool_input(&tool_state.input_buffer) {
-                                    tool_state.input = value.clone();
+                                // Per-delta logs format the whole buffer; skip them unless verbose
+                                let verbose = crate::logging::is_verbose();
+                                if verbose {
                                     crate::logging::info(format!(
-                                        "Tool '{}' input parsed: {:?}",
-                                        tool_state.name, value
+                                        "Tool '{}' input delta: {} (buffer now: {})",
+                                        tool_state.name, partial_json, tool_state.input_buffer
                                     ));
                                 }
+                                if let Some(value) = parse_tool_input(&tool_state.input_buffer) {
+                                    if verbose {
+                                        crate::logging::info(format!(
+                                            "Tool '{}' input parsed: {:?}",
+                                            tool_state.name, value
+                                        ));
+                                    }
+                                    tool_state.input = value;
+                                }
                             }
                         }
                     },
@@ -342,7 +342,7 @@ impl Default for RetryConfig {
             max_delay: 60.0,
             exponential_base: 2.0,
             jitter: true,
-            jitter_factor: 0.1,
+            jitter_factor: DEFAULT_JITTER_FACTOR,
             respect_retry_after: true,
             retryable_status_codes: vec![429, 500, 502, 503, 504],
             request_timeout: 120.0,
@@ -419,20 +419,7 @@ impl RetryConfig {
         let capped_delay = base_delay.min(self.max_delay);
 
         let final_delay = if self.jitter {
-            // Add random jitter to prevent thundering herd problem
-            // Uses a simple deterministic approach when rand is not available
-            let jitter_range = capped_delay * self.jitter_factor;
-
-            // Simple pseudo-random jitter based on current time
-            // This avoids adding the rand crate as a dependency
-            let nanos = std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .map(|d| d.subsec_nanos())
-                .unwrap_or(0);
-            let random_factor = f64::from(nanos % 1000) / 1000.0; // 0.0 to 0.999
-            let jitter = jitter_range * (2.0 * random_factor - 1.0); // -range to +range
-
-            (capped_delay + jitter).max(0.0)
+            apply_jitter(capped_delay, self.jitter_factor)
         } else {
             capped_delay
         };
@@ -455,11 +442,26 @@ impl From<RetryPolicy> for RetryConfig {
             initial_delay: policy.initial_delay,
             max_delay: policy.max_delay,
             exponential_base: policy.exponential_base,
+            jitter: policy.jitter,
             ..Default::default()
         }
     }
 }
 
+/// Default jitter as a fraction of the delay (10% variation).
+pub const DEFAULT_JITTER_FACTOR: f64 = 0.1;
+
+/// Applies random jitter of up to +/- `jitter_factor` to a delay (seconds).
+///
+/// Uses a real RNG rather than the clock: clock-derived values collapse to a
+/// handful of outcomes on coarse-resolution platforms, which keeps clients in
+/// lockstep and defeats the point of jitter.
+pub fn apply_jitter(delay: f64, jitter_factor: f64) -> f64 {
+    let random_factor = fastrand::f64(); // 0.0 to <1.0
+    let jitter = delay * jitter_factor * (2.0 * random_factor - 1.0); // -range to +range
+    (delay + jitter).max(0.0)
+}
+
 /// Converts back to `RetryPolicy` for compatibility
 impl From<RetryConfig> for RetryPolicy {
     fn from(config: RetryConfig) -> Self {
@@ -469,6 +471,7 @@ impl From<RetryConfig> for RetryPolicy {
             initial_delay: config.initial_delay,
             max_delay: config.max_delay,
             exponential_base: config.exponential_base,
+            jitter: config.jitter,
         }
     }
 }
@@ -886,6 +889,7 @@ mod tests {
             initial_delay: 2.0,
             max_delay: 30.0,
             exponential_base: 3.0,
+            jitter: false,
         };
 
         let config: RetryConfig = policy.clone().into();
@@ -894,6 +898,7 @@ mod tests {
         assert_f64_eq(config.initial_delay, policy.initial_delay);
         assert_f64_eq(config.max_delay, policy.max_delay);
         assert_f64_eq(config.exponential_base, policy.exponential_base);
+        assert_eq!(config.jitter, policy.jitter);
 
         // Convert back
         let policy2: RetryPolicy = config.into();
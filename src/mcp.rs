@@ -18,6 +18,7 @@ use std::sync::{Arc, Mutex};
 use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
 use anyhow::{Context, Result};
+use futures_util::future::join_all;
 use serde::{Deserialize, Serialize};
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt};
 use tokio::process::{Child, ChildStdin, ChildStdout};
@@ -229,12 +230,13 @@ impl McpConnection {
         }))
         .await?;
 
-        let response = self.recv(list_id).await?;
+        let mut response = self.recv(list_id).await?;
 
-        if let Some(result) = response.get("result")
-            && let Some(tools) = result.get("tools")
+        if let Some(tools) = response
+            .get_mut("result")
+            .and_then(|result| result.get_mut("tools"))
         {
-            self.tools = serde_json::from_value(tools.clone()).unwrap_or_default();
+            self.tools = serde_json::from_value(tools.take()).unwrap_or_default();
         }
 
         Ok(())
@@ -266,14 +268,15 @@ impl McpConnection {
         }))
         .await?;
 
-        let response = tokio::time::timeout(Duration::from_secs(timeout_secs), self.recv(call_id))
-            .await
-            .with_context(|| {
-                format!(
-                    "MCP tool '{}' on server '{}' timed out after {}s",
-                    tool_name, self.name, timeout_secs
-                )
-            })??;
+        let mut response =
+            tokio::time::timeout(Duration::from_secs(timeout_secs), self.recv(call_id))
+                .await
+                .with_context(|| {
+                    format!(
+                        "MCP tool '{}' on server '{}' timed out after {}s",
+                        tool_name, self.name, timeout_secs
+                    )
+                })??;
 
         if let Some(error) = response.get("error") {
             return Err(anyhow::anyhow!(
@@ -283,9 +286,9 @@ impl McpConnection {
         }
 
         Ok(response
-            .get("result")
-            .cloned()
-            .unwrap_or(serde_json::json!(null)))
+            .get_mut("result")
+            .map(serde_json::Value::take)
+            .unwrap_or(serde_json::Value::Null))
     }
 
     /// Get discovered tools
@@ -415,8 +418,7 @@ impl McpPool {
             .config
             .servers
             .get(server_name)
-            .ok_or_else(|| anyhow::anyhow!("Failed to find MCP server: {server_name}"))?
-            .clone();
+            .ok_or_else(|| anyhow::anyhow!("Failed to find MCP server: {server_name}"))?;
 
         if server_config.disabled {
             anyhow::bail!("Failed to connect MCP server '{server_name}': server is disabled");
@@ -424,7 +426,7 @@ impl McpPool {
 
         let connection = McpConnection::connect(
             server_name.to_string(),
-            server_config,
+            server_config.clone(),
             &self.config.timeouts,
         )
         .await?;
@@ -437,18 +439,39 @@ impl McpPool {
 
     /// Connect to all enabled servers, returning errors for failed connections
     pub async fn connect_all(&mut self) -> Vec<(String, anyhow::Error)> {
-        let mut errors = Vec::new();
-        let names: Vec<String> = self
+        let timeouts = self.config.timeouts;
+        let pending: Vec<(String, McpServerConfig)> = self
             .config
             .servers
-            .keys()
-            .filter(|n| !self.config.servers[*n].disabled)
-            .cloned()
+            .iter()
+            .filter(|(name, server)| {
+                !server.disabled
+                    && !self
+                        .connections
+                        .get(*name)
+                        .is_some_and(McpConnection::is_ready)
+            })
+            .map(|(name, server)| (name.clone(), server.clone()))
             .collect();
 
-        for name in names {
-            if let Err(e) = self.get_or_connect(&name).await {
-                errors.push((name, e));
+        // Servers are independent, so start them together: startup is bounded
+        // by the slowest server instead of the sum of every connect timeout.
+        let results = join_all(pending.into_iter().map(|(name, server)| async move {
+            let result = McpConnection::connect(name.clone(), server, &timeouts).await;
+            (name, result)
+        }))
+        .await;
+
+        let mut errors = Vec::new();
+        for (name, result) in results {
+            match result {
+                Ok(connection) => {
+                    self.connections.insert(name, connection);
+                }
+                Err(e) => {
+                    self.connections.remove(&name);
+                    errors.push((name, e));
+                }
             }
         }
 
@@ -464,6 +487,8 @@ impl McpPool {
                 tools.push((format!("mcp_{}_{}", server, tool.name), tool));
             }
         }
+        // Stable order keeps the tool list a cacheable prompt prefix
+        tools.sort_by(|a, b| a.0.cmp(&b.0));
         tools
     }
 
@@ -1000,4 +1025,38 @@ mod tests {
         assert!(pool.server_names().is_empty());
         assert!(pool.all_tools().is_empty());
     }
+
+    #[tokio::test]
+    async fn test_connect_all_reports_failures_and_skips_disabled() {
+        let server = |command: &str, disabled: bool| McpServerConfig {
+            command: command.to_string(),
+            args: Vec::new(),
+            env: HashMap::new(),
+            connect_timeout: Some(1),
+            execute_timeout: None,
+            read_timeout: None,
+            disabled,
+        };
+        let mut config = McpConfig::default();
+        config.servers.insert(
+            "first".to_string(),
+            server("axiom-test-missing-mcp-server-1", false),
+        );
+        config.servers.insert(
+            "second".to_string(),
+            server("axiom-test-missing-mcp-server-2", false),
+        );
+        config.servers.insert(
+            "off".to_string(),
+            server("axiom-test-missing-mcp-server-3", true),
+        );
+        let mut pool = McpPool::new(config);
+
+        let errors = pool.connect_all().await;
+
+        let mut failed: Vec<&str> = errors.iter().map(|(name, _)| name.as_str()).collect();
+        failed.sort_unstable();
+        assert_eq!(failed, vec!["first", "second"]);
+        assert!(pool.connections.is_empty());
+    }
 }
@@ -14,8 +14,11 @@
 
 #![allow(dead_code)] // Public API - some functions reserved for future use
 
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
+use std::time::SystemTime;
 
 use thiserror::Error;
 
@@ -30,6 +33,19 @@ const PROJECT_CONTEXT_FILES: &[&str] = &[
 /// Maximum size for project context files (to prevent loading huge files)
 const MAX_CONTEXT_SIZE: usize = 100 * 1024; // 100KB
 
+/// Context file contents from a previous load, keyed by path.
+///
+/// The system prompt is rebuilt on every turn, so unchanged files are served
+/// from here instead of being re-read from disk.
+static CONTEXT_FILE_CACHE: OnceLock<Mutex<HashMap<PathBuf, CachedContextFile>>> = OnceLock::new();
+
+#[derive(Debug, Clone)]
+struct CachedContextFile {
+    modified: SystemTime,
+    len: u64,
+    content: String,
+}
+
 // === Errors ===
 
 #[derive(Debug, Error)]
@@ -182,6 +198,18 @@ fn load_context_file(path: &Path) -> Result<String, ProjectContextError> {
         });
     }
 
+    // Reuse the previous read if the file is unchanged
+    let modified = metadata.modified().ok();
+    let cache = CONTEXT_FILE_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    if let Some(modified) = modified
+        && let Ok(guard) = cache.lock()
+        && let Some(cached) = guard.get(path)
+        && cached.modified == modified
+        && cached.len == metadata.len()
+    {
+        return Ok(cached.content.clone());
+    }
+
     // Read the file
     let content = fs::read_to_string(path).map_err(|source| ProjectContextError::Read {
         path: path.to_path_buf(),
@@ -195,6 +223,19 @@ fn load_context_file(path: &Path) -> Result<String, ProjectContextError> {
         });
     }
 
+    if let Some(modified) = modified
+        && let Ok(mut guard) = cache.lock()
+    {
+        guard.insert(
+            path.to_path_buf(),
+            CachedContextFile {
+                modified,
+                len: metadata.len(),
+                content: content.clone(),
+            },
+        );
+    }
+
     Ok(content)
 }
 
@@ -389,6 +430,27 @@ mod tests {
         assert!(!ctx.warnings.is_empty());
     }
 
+    #[test]
+    fn test_context_file_reloaded_after_change() {
+        let tmp = tempdir().expect("tempdir");
+        let agents_path = tmp.path().join("AGENTS.md");
+        fs::write(&agents_path, "First version").expect("write");
+
+        let first = load_project_context(tmp.path());
+        assert_eq!(first.instructions.as_deref(), Some("First version"));
+
+        // Served from the cache while unchanged
+        let again = load_project_context(tmp.path());
+        assert_eq!(again.instructions.as_deref(), Some("First version"));
+
+        fs::write(&agents_path, "Second, longer version").expect("write");
+        let updated = load_project_context(tmp.path());
+        assert_eq!(
+            updated.instructions.as_deref(),
+            Some("Second, longer version")
+        );
+    }
+
     #[test]
     fn test_check_trust_status() {
         let tmp = tempdir().expect("tempdir");
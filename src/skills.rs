@@ -1,5 +1,6 @@
 //! Skill discovery and registry for local SKILL.md files.
 
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
 
@@ -30,6 +31,8 @@ pub struct Skill {
 #[derive(Debug, Clone, Default)]
 pub struct SkillRegistry {
     skills: Vec<Skill>,
+    /// Index into `skills` by name; the first skill discovered wins.
+    by_name: HashMap<String, usize>,
 }
 
 impl SkillRegistry {
@@ -50,7 +53,7 @@ impl SkillRegistry {
                     if let Ok(content) = fs::read_to_string(&skill_path)
                         && let Some(skill) = Self::parse_skill(&skill_path, &content)
                     {
-                        registry.skills.push(skill);
+                        registry.insert(skill);
                     }
                 }
             }
@@ -58,6 +61,12 @@ impl SkillRegistry {
         registry
     }
 
+    fn insert(&mut self, skill: Skill) {
+        let index = self.skills.len();
+        self.by_name.entry(skill.name.clone()).or_insert(index);
+        self.skills.push(skill);
+    }
+
     fn parse_skill(_path: &Path, content: &str) -> Option<Skill> {
         let trimmed = content.trim_start();
         let (frontmatter, body) = if trimmed.starts_with("---") {
@@ -94,7 +103,7 @@ impl SkillRegistry {
 
     /// Lookup a skill by name.
     pub fn get(&self, name: &str) -> Option<&Skill> {
-        self.skills.iter().find(|s| s.name == name)
+        self.by_name.get(name).map(|&index| &self.skills[index])
     }
 
     /// Return all loaded skills.
@@ -200,3 +209,44 @@ pub fn show(skills_dir: &Path, name: &str) -> Result<()> {
     println!("{contents}");
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::tempdir;
+
+    fn write_skill(root: &Path, dir: &str, name: &str, body: &str) {
+        let skill_dir = root.join(dir);
+        fs::create_dir_all(&skill_dir).expect("create skill dir");
+        fs::write(
+            skill_dir.join("SKILL.md"),
+            format!("---\nname: {name}\ndescription: test skill\n---\n{body}\n"),
+        )
+        .expect("write SKILL.md");
+    }
+
+    #[test]
+    fn test_get_uses_name_index() {
+        let tmp = tempdir().expect("tempdir");
+        write_skill(tmp.path(), "review", "review", "Review the diff.");
+        write_skill(tmp.path(), "dup-a", "dup", "First body.");
+        write_skill(tmp.path(), "dup-b", "dup", "Second body.");
+
+        let registry = SkillRegistry::discover(tmp.path());
+        assert_eq!(registry.len(), 3);
+
+        let review = registry.get("review").expect("review skill");
+        assert_eq!(review.body, "Review the diff.");
+        assert!(registry.get("missing").is_none());
+
+        // read_dir order is unspecified, so compare against what a linear
+        // scan of the discovered list returns for the duplicated name.
+        let first_dup = registry
+            .list()
+            .iter()
+            .find(|skill| skill.name == "dup")
+            .expect("dup skill");
+        let indexed = registry.get("dup").expect("indexed dup skill");
+        assert!(std::ptr::eq(indexed, first_dup));
+    }
+}
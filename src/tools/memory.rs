@@ -8,8 +8,20 @@ use super::spec::{
 };
 use async_trait::async_trait;
 use serde_json::{Value, json};
-use std::fs;
-use std::path::PathBuf;
+use std::io::ErrorKind;
+use std::path::{Path, PathBuf};
+use tokio::fs;
+
+/// Read the memory file without blocking the runtime, treating a missing file as empty.
+async fn read_memory_file(path: &Path) -> Result<Option<String>, ToolError> {
+    match fs::read_to_string(path).await {
+        Ok(content) => Ok(Some(content)),
+        Err(e) if e.kind() == ErrorKind::NotFound => Ok(None),
+        Err(e) => Err(ToolError::execution_failed(format!(
+            "Failed to read memory file: {e}"
+        ))),
+    }
+}
 
 /// Tool for saving a fact to long-term memory.
 pub struct SaveMemoryTool {
@@ -22,29 +34,28 @@ impl SaveMemoryTool {
         Self { memory_path }
     }
 
-    fn ensure_memory_dir(&self) -> Result<(), ToolError> {
+    async fn ensure_memory_dir(&self) -> Result<(), ToolError> {
         if let Some(parent) = self.memory_path.parent() {
-            fs::create_dir_all(parent).map_err(|e| {
+            fs::create_dir_all(parent).await.map_err(|e| {
                 ToolError::execution_failed(format!("Failed to create memory directory: {e}"))
             })?;
         }
         Ok(())
     }
 
-    fn load_memory(&self) -> Result<Vec<String>, ToolError> {
-        if !self.memory_path.exists() {
+    async fn load_memory(&self) -> Result<Vec<String>, ToolError> {
+        let Some(content) = read_memory_file(&self.memory_path).await? else {
             return Ok(Vec::new());
-        }
-        let content = fs::read_to_string(&self.memory_path)
-            .map_err(|e| ToolError::execution_failed(format!("Failed to read memory file: {e}")))?;
+        };
         serde_json::from_str(&content)
             .map_err(|e| ToolError::execution_failed(format!("Failed to parse memory file: {e}")))
     }
 
-    fn save_memory(&self, facts: &[String]) -> Result<(), ToolError> {
+    async fn save_memory(&self, facts: &[String]) -> Result<(), ToolError> {
         let content = serde_json::to_string_pretty(facts)
             .map_err(|e| ToolError::execution_failed(format!("Failed to serialize memory: {e}")))?;
         fs::write(&self.memory_path, content)
+            .await
             .map_err(|e| ToolError::execution_failed(format!("Failed to write memory file: {e}")))
     }
 }
@@ -82,13 +93,13 @@ impl ToolSpec for SaveMemoryTool {
 
     async fn execute(&self, input: Value, _context: &ToolContext) -> Result<ToolResult, ToolError> {
         let fact = required_str(&input, "fact")?;
-        self.ensure_memory_dir()?;
-        let mut facts = self.load_memory()?;
+        self.ensure_memory_dir().await?;
+        let mut facts = self.load_memory().await?;
 
         // Avoid duplicates
         if !facts.contains(&fact.to_string()) {
             facts.push(fact.to_string());
-            self.save_memory(&facts)?;
+            self.save_memory(&facts).await?;
             Ok(ToolResult::success(format!("Fact remembered: {fact}")))
         } else {
             Ok(ToolResult::success("I already remember that fact."))
@@ -134,11 +145,9 @@ impl ToolSpec for GetMemoryTool {
         _input: Value,
         _context: &ToolContext,
     ) -> Result<ToolResult, ToolError> {
-        if !self.memory_path.exists() {
+        let Some(content) = read_memory_file(&self.memory_path).await? else {
             return Ok(ToolResult::success("No facts remembered yet."));
-        }
-        let content = fs::read_to_string(&self.memory_path)
-            .map_err(|e| ToolError::execution_failed(format!("Failed to read memory file: {e}")))?;
+        };
         let facts: Vec<String> = serde_json::from_str(&content).map_err(|e| {
             ToolError::execution_failed(format!("Failed to parse memory file: {e}"))
         })?;
@@ -118,9 +118,13 @@ impl ToolRegistry {
     }
 
     /// Convert all tools to API Tool format for sending to the model.
+    ///
+    /// Tools are sorted by name so the serialized list is identical from turn
+    /// to turn and stays a stable, cacheable prompt prefix.
     #[must_use]
     pub fn to_api_tools(&self) -> Vec<Tool> {
-        self.tools
+        let mut tools: Vec<Tool> = self
+            .tools
             .values()
             .map(|tool| Tool {
                 name: tool.name().to_string(),
@@ -128,7 +132,9 @@ impl ToolRegistry {
                 input_schema: tool.input_schema(),
                 cache_control: None,
             })
-            .collect()
+            .collect();
+        tools.sort_by(|a, b| a.name.cmp(&b.name));
+        tools
     }
 
     /// Convert tools to API Tool format with optional cache control on the last tool.
@@ -599,6 +605,24 @@ mod tests {
         assert_eq!(api_tools[0].description, "A test tool");
     }
 
+    #[test]
+    fn test_registry_to_api_tools_sorted_by_name() {
+        let tmp = tempdir().expect("tempdir");
+        let ctx = ToolContext::new(tmp.path().to_path_buf());
+        let mut registry = ToolRegistry::new(ctx);
+
+        for name in ["zeta", "alpha", "mid"] {
+            registry.register(make_test_tool(name));
+        }
+
+        let names: Vec<String> = registry
+            .to_api_tools()
+            .into_iter()
+            .map(|tool| tool.name)
+            .collect();
+        assert_eq!(names, vec!["alpha", "mid", "zeta"]);
+    }
+
     #[test]
     fn test_registry_remove() {
         let tmp = tempdir().expect("tempdir");
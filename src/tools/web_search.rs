@@ -8,12 +8,29 @@ use async_trait::async_trait;
 use regex::Regex;
 use serde::Serialize;
 use serde_json::{Value, json};
+use std::sync::OnceLock;
 use std::time::Duration;
 
 const DEFAULT_MAX_RESULTS: usize = 5;
 const MAX_RESULTS: usize = 10;
 const DEFAULT_TIMEOUT_MS: u64 = 15_000;
 const USER_AGENT: &str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15";
+const FETCH_TIMEOUT_SECS: u64 = 30;
+
+/// HTTP client shared by the web tools so repeated calls reuse pooled
+/// connections instead of paying DNS/TCP/TLS setup every time.
+static HTTP_CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+
+fn http_client() -> Result<&'static reqwest::Client, ToolError> {
+    if let Some(client) = HTTP_CLIENT.get() {
+        return Ok(client);
+    }
+    let client = reqwest::Client::builder()
+        .user_agent(USER_AGENT)
+        .build()
+        .map_err(|e| ToolError::execution_failed(format!("Failed to build HTTP client: {e}")))?;
+    Ok(HTTP_CLIENT.get_or_init(|| client))
+}
 
 #[derive(Debug, Clone, Serialize)]
 struct WebSearchEntry {
@@ -86,18 +103,13 @@ impl ToolSpec for WebSearchTool {
         .clamp(1, MAX_RESULTS);
         let timeout_ms = optional_u64(&input, "timeout_ms", DEFAULT_TIMEOUT_MS).min(60_000);
 
-        let client = reqwest::Client::builder()
-            .timeout(Duration::from_millis(timeout_ms))
-            .user_agent(USER_AGENT)
-            .build()
-            .map_err(|e| {
-                ToolError::execution_failed(format!("Failed to build HTTP client: {e}"))
-            })?;
+        let client = http_client()?;
 
         let encoded = url_encode(&query);
         let url = format!("https://html.duckduckgo.com/html/?q={encoded}");
         let resp = client
             .get(&url)
+            .timeout(Duration::from_millis(timeout_ms))
             .header(
                 "Accept",
                 "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -181,16 +193,11 @@ impl ToolSpec for WebFetchTool {
     async fn execute(&self, input: Value, _context: &ToolContext) -> Result<ToolResult, ToolError> {
         let url = required_str(&input, "url")?;
 
-        let client = reqwest::Client::builder()
-            .timeout(Duration::from_secs(30))
-            .user_agent(USER_AGENT)
-            .build()
-            .map_err(|e| {
-                ToolError::execution_failed(format!("Failed to build HTTP client: {e}"))
-            })?;
+        let client = http_client()?;
 
         let resp = client
             .get(url)
+            .timeout(Duration::from_secs(FETCH_TIMEOUT_SECS))
             .send()
             .await
             .map_err(|e| ToolError::execution_failed(format!("Request failed: {e}")))?;
@@ -212,14 +219,33 @@ impl ToolSpec for WebFetchTool {
     }
 }
 
+static TITLE_REGEX: OnceLock<Regex> = OnceLock::new();
+static SNIPPET_REGEX: OnceLock<Regex> = OnceLock::new();
+static TAG_REGEX: OnceLock<Regex> = OnceLock::new();
+
+fn get_title_regex() -> &'static Regex {
+    TITLE_REGEX.get_or_init(|| {
+        Regex::new(r#"<a[^>]*class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>"#).unwrap()
+    })
+}
+
+fn get_snippet_regex() -> &'static Regex {
+    SNIPPET_REGEX.get_or_init(|| {
+        Regex::new(
+            r#"<a[^>]*class="result__snippet"[^>]*>(.*?)</a>|<div[^>]*class="result__snippet"[^>]*>(.*?)</div>"#,
+        )
+        .unwrap()
+    })
+}
+
+fn get_tag_regex() -> &'static Regex {
+    // Stripped once per title/snippet, so compile it a single time.
+    TAG_REGEX.get_or_init(|| Regex::new(r"<[^>]+>").unwrap())
+}
+
 fn parse_duckduckgo_results(html: &str, max_results: usize) -> Vec<WebSearchEntry> {
-    let title_re =
-        Regex::new(r#"<a[^>]*class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>"#).unwrap();
-    let snippet_re = Regex::new(
-        r#"<a[^>]*class="result__snippet"[^>]*>(.*?)</a>|<div[^>]*class="result__snippet"[^>]*>(.*?)</div>"#,
-    )
-    .unwrap();
-    let snippets: Vec<String> = snippet_re
+    let title_re = get_title_regex();
+    let snippets: Vec<String> = get_snippet_regex()
         .captures_iter(html)
         .filter_map(|cap| cap.get(1).or_else(|| cap.get(2)))
         .map(|m| normalize_text(m.as_str()))
@@ -275,8 +301,7 @@ fn normalize_text(text: &str) -> String {
 }
 
 fn strip_html_tags(text: &str) -> String {
-    let tag_re = Regex::new(r"<[^>]+>").unwrap();
-    tag_re.replace_all(text, "").to_string()
+    get_tag_regex().replace_all(text, "").to_string()
 }
 
 fn decode_html_entities(text: &str) -> String {
@@ -4,42 +4,24 @@
 mod simple_tests {
     use std::fs;
 
+    use tempfile::tempdir;
+
     #[test]
     fn test_temp_dir_creation() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-simple-test-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
+        let tmp = tempdir()?;
+        let dir = tmp.path();
 
         assert!(dir.exists());
         assert!(dir.is_dir());
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 
     #[test]
     fn test_config_file_creation() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-config-test-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
+        let tmp = tempdir()?;
 
-        let config_path = dir.join(".axiom").join("config.toml");
+        let config_path = tmp.path().join(".axiom").join("config.toml");
         fs::create_dir_all(config_path.parent().unwrap())?;
 
         let content = r#"api_key = "test-key-123"
@@ -52,31 +34,19 @@ default_model = "anthropic/claude-3-5-sonnet-20241022"
         assert!(read.contains("test-key-123"));
         assert!(read.contains("anthropic/claude-3-5-sonnet-20241022"));
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 
     #[test]
     fn test_workspace_creation() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-workspace-test-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
+        let tmp = tempdir()?;
 
-        let workspace = dir.join("workspace");
+        let workspace = tmp.path().join("workspace");
         fs::create_dir_all(&workspace)?;
 
         assert!(workspace.exists());
         assert!(workspace.is_dir());
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 }
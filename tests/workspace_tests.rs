@@ -5,21 +5,13 @@ mod workspace_tests {
     use std::fs;
     use std::path::PathBuf;
 
+    use tempfile::tempdir;
+
     #[test]
     fn test_workspace_validation() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-workspace-safety-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
-
-        let workspace = dir.join("workspace");
+        let tmp = tempdir()?;
+
+        let workspace = tmp.path().join("workspace");
         fs::create_dir_all(&workspace)?;
 
         // File in workspace should be valid
@@ -31,29 +23,18 @@ mod workspace_tests {
 
         assert!(valid_str.starts_with(workspace_str.as_ref()));
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 
     #[test]
     fn test_workspace_outside_path() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-workspace-outside-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
-
-        let workspace = dir.join("workspace");
+        let tmp = tempdir()?;
+
+        let workspace = tmp.path().join("workspace");
         fs::create_dir_all(&workspace)?;
 
         // File outside workspace
-        let outside_file = dir.join("outside.txt");
+        let outside_file = tmp.path().join("outside.txt");
 
         // Validate file doesn't start with workspace
         let outside_str = outside_file.to_string_lossy();
@@ -61,25 +42,14 @@ mod workspace_tests {
 
         assert!(!outside_str.starts_with(workspace_str.as_ref()));
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 
     #[test]
     fn test_path_normalization() -> Result<(), std::io::Error> {
-        let temp = std::env::temp_dir();
-        let nanos = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap()
-            .as_nanos();
-        let dir = temp.join(format!(
-            "axiom-path-normalize-{}-{}",
-            std::process::id(),
-            nanos
-        ));
-        fs::create_dir_all(&dir)?;
-
-        let workspace = dir.join("workspace");
+        let tmp = tempdir()?;
+
+        let workspace = tmp.path().join("workspace");
         fs::create_dir_all(&workspace)?;
 
         // Test relative path resolution
@@ -93,7 +63,6 @@ mod workspace_tests {
                 .starts_with(workspace.to_string_lossy().as_ref())
         );
 
-        fs::remove_dir_all(&dir)?;
         Ok(())
     }
 }